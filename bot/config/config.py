@@ -1,42 +1,113 @@
-from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
-
-class Settings(BaseSettings):
-    model_config = SettingsConfigDict(env_file=".env", env_ignore_empty=True)
-
-    API_ID: int = None
-    API_HASH: str = None
-    GLOBAL_CONFIG_PATH: str = "TG_FARM"
-
-    FIX_CERT: bool = False
-    SESSION_START_DELAY: int = 360
-    REF_ID: str = 'dIk9eL'
-    
-    SESSIONS_PER_PROXY: int = 1
-    USE_PROXY: bool = True
-    DISABLE_PROXY_REPLACE: bool = False
-    DEVICE_PARAMS: bool = False
-    DEBUG_LOGGING: bool = False
-
-    AUTO_UPDATE: bool = True
-    CHECK_UPDATE_INTERVAL: int = 300
-    BLACKLISTED_SESSIONS: str = ""
-
-    SLEEP_BETWEEN_TAP: List[int] = [3, 8]
-    SLEEP_BY_MIN_ENERGY: List[int] = [1800, 10800]
-    
-    RANDOM_TAPS_COUNT: List[int] = [35, 100]
-    MIN_AVAILABLE_ENERGY: int = 10
-
-    MAX_TAP_LEVEL: int = 10
-    MAX_ENERGY_LEVEL: int = 10
-    MAX_CHARGE_LEVEL: int = 10
-    MAX_YESPAC_LEVEL: int = 2
-
-    AUTO_BIND_WALLET: bool = False
+import os
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in ('1', 'true', 'yes', 'on', 'y')
+
+
+def _parse_int_list(value: str) -> list[int]:
+    return [int(x) for x in value.strip('[] ').split(',') if x.strip()]
+
+
+_ENV_FILE_PATH = os.path.abspath('.env')
+_ENV_FILE_CACHE: dict = {}
+
+
+def _read_env_file(env_path: str = _ENV_FILE_PATH) -> dict:
+    env_values = {}
+    if 'API_ID' in os.environ:
+        # The orchestrator already exported the .env values into the process
+        # environment; skip the file parse entirely.
+        return env_values
+    try:
+        mtime = os.stat(env_path).st_mtime_ns
+    except OSError:
+        return env_values
+    cached = _ENV_FILE_CACHE.get(env_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    with open(env_path, encoding='utf-8-sig') as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, _, value = line.partition('=')
+            env_values[key.strip()] = value.strip().strip('\'"')
+    _ENV_FILE_CACHE[env_path] = (mtime, env_values)
+    return env_values
+
+
+_FIELDS = {
+    'API_ID': (int, None),
+    'API_HASH': (str, None),
+    'GLOBAL_CONFIG_PATH': (str, "TG_FARM"),
+
+    'FIX_CERT': (_parse_bool, False),
+    'SESSION_START_DELAY': (int, 360),
+    'REF_ID': (str, 'dIk9eL'),
+
+    'SESSIONS_PER_PROXY': (int, 1),
+    'USE_PROXY': (_parse_bool, True),
+    'DISABLE_PROXY_REPLACE': (_parse_bool, False),
+    'DEVICE_PARAMS': (_parse_bool, False),
+    'DEBUG_LOGGING': (_parse_bool, False),
+
+    'AUTO_UPDATE': (_parse_bool, True),
+    'CHECK_UPDATE_INTERVAL': (int, 300),
+    'BLACKLISTED_SESSIONS': (str, ""),
+
+    'SLEEP_BETWEEN_TAP': (_parse_int_list, [3, 8]),
+    'SLEEP_BY_MIN_ENERGY': (_parse_int_list, [1800, 10800]),
+
+    'RANDOM_TAPS_COUNT': (_parse_int_list, [35, 100]),
+    'MIN_AVAILABLE_ENERGY': (int, 10),
+
+    'MAX_TAP_LEVEL': (int, 10),
+    'MAX_ENERGY_LEVEL': (int, 10),
+    'MAX_CHARGE_LEVEL': (int, 10),
+    'MAX_YESPAC_LEVEL': (int, 2),
+
+    'AUTO_BIND_WALLET': (_parse_bool, False),
+}
+
+
+class Settings:
+    """Env-backed settings resolved lazily: each field is parsed from the
+    environment (or `.env`) on first access and cached on the instance."""
+
+    __slots__ = ('_env_file_values', '_resolved')
+
+    def __init__(self):
+        self._env_file_values = None
+        self._resolved = {}
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls()
+
+    def __getattr__(self, name: str):
+        resolved = self._resolved
+        if name in resolved:
+            return resolved[name]
+        try:
+            convert, default = _FIELDS[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        raw = os.environ.get(name)
+        if raw is None:
+            if self._env_file_values is None:
+                self._env_file_values = _read_env_file()
+            raw = self._env_file_values.get(name)
+        value = default if raw is None or raw == '' else convert(raw)
+        resolved[name] = value
+        return value
 
     @property
-    def blacklisted_sessions(self) -> List[str]:
-        return [s.strip() for s in self.BLACKLISTED_SESSIONS.split(',') if s.strip()]
+    def blacklisted_sessions(self) -> frozenset:
+        cached = self._resolved.get('blacklisted_sessions')
+        if cached is None:
+            cached = frozenset(s.strip() for s in self.BLACKLISTED_SESSIONS.split(',') if s.strip())
+            self._resolved['blacklisted_sessions'] = cached
+        return cached
 
-settings = Settings()
+settings = Settings.from_env()
@@ -1,6 +1,11 @@
-from typing import Dict
+import sys
+import zlib
+from functools import lru_cache
+from multidict import CIMultiDict, CIMultiDictProxy, istr
+from collections.abc import Mapping
+from types import MappingProxyType
 
-HEADERS = {
+HEADERS = MappingProxyType({istr(k): sys.intern(v) for k, v in {
     'accept': 'application/json, text/plain, */*',
     'accept-language': 'ru,en-US;q=0.9,en;q=0.8',
     'cache-control': 'no-cache',
@@ -17,10 +22,27 @@ HEADERS = {
     'sec-fetch-mode': 'cors',
     'sec-fetch-site': 'same-site',
     'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-}
+}.items()})
 
-def get_auth_headers(token: str) -> Dict[str, str]:
-    auth_headers = HEADERS.copy()
-    auth_headers['authorization'] = f'Bearer {token}'
-    auth_headers['lang'] = 'en'
-    return auth_headers
+# Static portion of the headers serialized once in wire format; the dynamic
+# authorization line is the only thing a consumer needs to append.
+STATIC_HEADER_BLOB = ''.join(f'{k}: {v}\r\n' for k, v in HEADERS.items()).encode('ascii') + b'lang: en\r\n'
+
+# 32-bit identity of the static header set: comparing two sessions' headers
+# is an int compare instead of walking 17 key/value pairs.
+HEADERS_FP = zlib.crc32(STATIC_HEADER_BLOB)
+
+AUTHORIZATION = istr('authorization')
+LANG = istr('lang')
+
+_AUTH_BASE = CIMultiDict({**HEADERS, LANG: sys.intern('en')})
+BEARER_PREFIX = sys.intern('Bearer ')
+
+@lru_cache(maxsize=32)
+def _build_auth_headers(token: str) -> Mapping[str, str]:
+    auth_headers = CIMultiDict(_AUTH_BASE)
+    auth_headers[AUTHORIZATION] = BEARER_PREFIX + token
+    return CIMultiDictProxy(auth_headers)
+
+def get_auth_headers(token: str) -> Mapping[str, str]:
+    return _build_auth_headers(token)
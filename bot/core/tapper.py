@@ -1,12 +1,16 @@
 import aiohttp
 import asyncio
+import orjson
 from typing import Dict, Optional, Any, Tuple, List
-from urllib.parse import urlencode, unquote
+from urllib.parse import unquote, urlsplit, parse_qsl
 from aiocfscrape import CloudflareScraper
 from aiohttp_proxy import ProxyConnector
 from better_proxy import Proxy
-from random import uniform, randint
-from time import time
+from collections import ChainMap
+from functools import wraps
+from operator import itemgetter
+from random import uniform, randint, random
+from time import time, monotonic
 from datetime import datetime, timezone
 import json
 import os
@@ -18,14 +22,78 @@ from bot.utils.wallet_utils import create_and_save_wallet, get_wallet_data
 from bot.config import settings
 from bot.utils import logger, config_utils, CONFIG_PATH
 from bot.exceptions import InvalidSession
-from bot.core.headers import HEADERS, get_auth_headers
+from bot.core.headers import HEADERS
 from bot.core.helper import format_duration
 
 
+class _URL:
+    BASE = 'https://bi.yescoin.gold'
+    LOGIN = f'{BASE}/user/login'
+    PROFILE = f'{BASE}/account/getAccountInfo'
+    GAME_INFO = f'{BASE}/game/getGameInfo'
+    BUILD_INFO = f'{BASE}/build/getAccountBuildInfo'
+    SPECIAL_BOX_INFO = f'{BASE}/game/getSpecialBoxInfo'
+    LEVEL_UP = f'{BASE}/build/levelUp'
+    RECOVER_SPECIAL_BOX = f'{BASE}/game/recoverSpecialBox'
+    RECOVER_COIN_POOL = f'{BASE}/game/recoverCoinPool'
+    COLLECT_COIN = f'{BASE}/game/collectCoin'
+    COLLECT_SPECIAL_BOX_COIN = f'{BASE}/game/collectSpecialBoxCoin'
+    USER_INFO = f'{BASE}/user/info'
+    USER_ACTIVE_LEVEL = f'{BASE}/activity/userActiveLevel'
+    STOP_BONUS = f'{BASE}/account/getUserStopBonus'
+    CLAIM_STOP_BONUS = f'{BASE}/account/claimStopBonus'
+    JOIN_ACTIVITY = f'{BASE}/activity/doJoinActivity'
+    ACTIVITY_STATUS = f'{BASE}/activity/getJoinActivityStatus'
+    CLAIM_GIFT_BOX = f'{BASE}/invite/claimGiftBox'
+    TASK_LIST = f'{BASE}/task/getTaskList'
+    CLICK_TASK = f'{BASE}/task/clickTask'
+    CHECK_TASK = f'{BASE}/task/checkTask'
+    CLAIM_TASK_REWARD = f'{BASE}/task/claimTaskReward'
+    TASK_BONUS_INFO = f'{BASE}/task/getFinishTaskBonusInfo'
+    UPGRADE_TASKS = f'{BASE}/task/getUserUpgradeTaskList'
+    FINISH_UPGRADE_TASK = f'{BASE}/task/finishUserUpgradeTask'
+    CLAIM_BONUS = f'{BASE}/task/claimBonus'
+    DAILY_MISSIONS = f'{BASE}/mission/getDailyMission'
+    CLICK_DAILY_MISSION = f'{BASE}/mission/clickDailyMission'
+    CHECK_DAILY_MISSION = f'{BASE}/mission/checkDailyMission'
+    CLAIM_MISSION_REWARD = f'{BASE}/mission/claimReward'
+    MY_SQUAD = f'{BASE}/squad/mySquad'
+    RECOMMEND_SQUADS = f'{BASE}/squad/getRecommendSquadList'
+    JOIN_SQUAD = f'{BASE}/squad/joinSquad'
+    OFFLINE_BONUS_INFO = f'{BASE}/game/getOfflineYesPacBonusInfo'
+    CLAIM_OFFLINE_BONUS = f'{BASE}/game/claimOfflineBonus'
+    SIGNIN_LIST = f'{BASE}/signIn/list'
+    CLAIM_SIGNIN = f'{BASE}/signIn/claim'
+    GET_WALLET = f'{BASE}/wallet/getWallet'
+    BIND_WALLET = f'{BASE}/wallet/bind'
+
+
 class TooManyRequestsError(Exception):
     pass
 
 
+_TASK_FIELDS = itemgetter('taskId', 'taskName', 'taskBonusAmount')
+
+
+def _safe(label: str, default: Any = None, sleep_on_error: float = 3):
+    """Shared log-and-return-default error handling for endpoint methods whose
+    success paths need bespoke logic; rate limiting still propagates."""
+    def decorator(fn):
+        @wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await fn(self, *args, **kwargs)
+            except TooManyRequestsError:
+                raise
+            except Exception as error:
+                logger.error(f"{self.session_name} | {label}: {error}")
+                if sleep_on_error:
+                    await asyncio.sleep(sleep_on_error)
+                return default
+        return wrapper
+    return decorator
+
+
 class BaseBot:
 
     def __init__(self, tg_client: UniversalTelegramClient):
@@ -35,11 +103,16 @@ class BaseBot:
 
         self.session_name = tg_client.session_name
         self._http_client: Optional[CloudflareScraper] = None
+        self._request_methods: Dict[str, Any] = {}
         self._current_proxy: Optional[str] = None
+        self._proxy_connectors: Dict[str, ProxyConnector] = {}
         self._access_token: Optional[str] = None
+        self._token_header: Optional[Dict[str, str]] = None
         self._is_first_run: Optional[bool] = None
         self._init_data: Optional[str] = None
-        self._current_ref_id: Optional[str] = None
+        self._prefetched_profile: Optional[Dict[str, Any]] = None
+        self._get_cache: Dict[str, Tuple[float, Any]] = {}
+        self._current_ref_id: str = settings.REF_ID if randint(1, 100) <= 70 else 'dIk9eL'
         self._headers = HEADERS.copy()
 
         session_config = config_utils.get_session_config(self.session_name, CONFIG_PATH)
@@ -53,10 +126,11 @@ class BaseBot:
             self.tg_client.set_proxy(proxy)
             self._current_proxy = self.proxy
 
+    def _set_access_token(self, token: Optional[str]) -> None:
+        self._access_token = token
+        self._token_header = {'token': token} if token else None
+
     def get_ref_id(self) -> str:
-        if self._current_ref_id is None:
-            random_number = randint(1, 100)
-            self._current_ref_id = settings.REF_ID if random_number <= 70 else 'dIk9eL'
         return self._current_ref_id
 
     async def get_tg_web_data(self, app_name: str = "theYescoin_bot", path: str = "Yescoin") -> str:
@@ -75,11 +149,13 @@ class BaseBot:
             if 'startapp=' not in webview_url and 'start=' not in webview_url:
                 webview_url = webview_url.replace('#tgWebAppData=', f'?startapp={ref_id}#tgWebAppData=')
 
-            encoded_data = webview_url.split('tgWebAppData=')[1].split('&tgWebAppVersion')[0]
-            decoded_data = unquote(unquote(encoded_data))
-
-            if 'start_param' in decoded_data:
-                start_param = decoded_data.split('start_param=')[1].split('&')[0]
+            fragment = urlsplit(webview_url).fragment
+            decoded_data = dict(parse_qsl(fragment, keep_blank_values=True)).get('tgWebAppData')
+            if not decoded_data:
+                raise InvalidSession("Failed to get data")
+            # tgWebAppData is percent-encoded twice in the fragment; parse_qsl
+            # removed one layer, the API expects the fully decoded form.
+            decoded_data = unquote(decoded_data)
 
             self._init_data = decoded_data
             return decoded_data
@@ -88,6 +164,26 @@ class BaseBot:
             logger.error(f"{self.session_name} | Error retrieving data: {str(e)}")
             raise InvalidSession("Failed to get data")
 
+    def _get_proxy_connector(self, proxy_url: str) -> ProxyConnector:
+        connector = self._proxy_connectors.get(proxy_url)
+        if connector is None or connector.closed:
+            connector = ProxyConnector.from_url(
+                proxy_url,
+                limit=8,
+                limit_per_host=8,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+            self._proxy_connectors[proxy_url] = connector
+        return connector
+
+    async def _close_proxy_connectors(self) -> None:
+        for connector in self._proxy_connectors.values():
+            if not connector.closed:
+                await connector.close()
+        self._proxy_connectors.clear()
+
     async def check_and_update_proxy(self, accounts_config: dict) -> bool:
         if not settings.USE_PROXY:
             return True
@@ -99,14 +195,17 @@ class BaseBot:
 
             self._current_proxy = new_proxy
             if self._http_client and not self._http_client.closed:
-                await self._http_client.close()
-
-            proxy_conn = {'connector': ProxyConnector.from_url(new_proxy)}
-            self._http_client = CloudflareScraper(
-                timeout=aiohttp.ClientTimeout(60),
-                headers=self._headers,
-                **proxy_conn
-            )
+                # Swap only the connector so the shared session (and its
+                # TLS/DNS caches) survives the proxy rotation. Connectors are
+                # pooled per proxy URL, so rotating back to a known proxy
+                # reuses its keep-alive pool.
+                old_connector = self._http_client._connector
+                self._http_client._connector = self._get_proxy_connector(new_proxy)
+                # A displaced direct connector is not in the per-proxy pool,
+                # so nothing else would ever close it.
+                if old_connector is not None and not old_connector.closed \
+                        and old_connector not in self._proxy_connectors.values():
+                    await old_connector.close()
             logger.info(f"Switched to new proxy: {new_proxy}")
 
         return True
@@ -132,33 +231,52 @@ class BaseBot:
         
         for attempt in range(max_retries):
             try:
-                headers = self._headers.copy()
-                
-                if self._access_token:
-                    headers['token'] = self._access_token
-                    
-                if 'headers' in kwargs:
-                    headers.update(kwargs['headers'])
-                kwargs['headers'] = headers
-
-                async with getattr(self._http_client, method.lower())(url, **kwargs) as response:
+                # The session already carries self._headers as defaults;
+                # only the per-request delta needs to be passed here.
+                if self._token_header is not None:
+                    extra = kwargs.get('headers')
+                    kwargs['headers'] = ChainMap(extra, self._token_header) if extra else self._token_header
+
+                request = self._request_methods.get(method) or getattr(self._http_client, method.lower())
+                async with request(url, **kwargs) as response:
                     if response.status == 200:
-                        return await response.json()
+                        # content_type=None skips aiohttp's mimetype check so
+                        # bodies served without application/json still decode.
+                        return await response.json(loads=orjson.loads, content_type=None)
                     elif response.status == 429:
-                        return None
+                        # Status and headers are enough here: hand the
+                        # connection back without draining the body.
+                        retry_after = response.headers.get('Retry-After')
+                        response.release()
+                        if attempt < max_retries - 1:
+                            try:
+                                delay = float(retry_after)
+                            except (TypeError, ValueError):
+                                delay = self._backoff_delay(base_delay, attempt)
+                            await asyncio.sleep(delay)
+                            continue
+                        raise TooManyRequestsError(url)
                     else:
+                        response.release()
                         logger.error(f"{self.session_name} | ❌ Error {response.status} | {url}")
                         return None
-                        
+
+            except TooManyRequestsError:
+                raise
             except Exception as e:
                 logger.error(f"{self.session_name} | ❌ Request error: {str(e)}")
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(base_delay * (attempt + 1))
+                    await asyncio.sleep(self._backoff_delay(base_delay, attempt))
                     continue
                 return None
-                
+
         return None
 
+    @staticmethod
+    def _backoff_delay(base_delay: float, attempt: int) -> float:
+        # Exponential backoff with full jitter, capped at 30 seconds.
+        return min(30, base_delay * 2 ** attempt) * (0.5 + random())
+
     async def run(self) -> None:
         if not await self.initialize_session():
             return
@@ -167,30 +285,39 @@ class BaseBot:
         logger.info(f"Bot will start in {int(random_delay)}s")
         await asyncio.sleep(random_delay)
 
-        proxy_conn = {'connector': ProxyConnector.from_url(self._current_proxy)} if self._current_proxy else {}
+        connector = self._get_proxy_connector(self._current_proxy) if self._current_proxy \
+            else aiohttp.TCPConnector(ttl_dns_cache=300, limit=10, limit_per_host=8,
+                                      keepalive_timeout=75, enable_cleanup_closed=True,
+                                      force_close=False)
         async with CloudflareScraper(
             timeout=aiohttp.ClientTimeout(60),
             headers=self._headers,
-            **proxy_conn
+            connector=connector,
+            cookie_jar=aiohttp.DummyCookieJar(),
+            json_serialize=lambda obj: orjson.dumps(obj).decode()
         ) as http_client:
             self._http_client = http_client
+            self._request_methods = {'GET': http_client.get, 'POST': http_client.post}
 
-            while True:
-                try:
-                    session_config = config_utils.get_session_config(self.session_name, CONFIG_PATH)
-                    if not await self.check_and_update_proxy(session_config):
-                        logger.warning('Failed to find working proxy. Sleep 5 minutes.')
-                        await asyncio.sleep(300)
-                        continue
+            try:
+                while True:
+                    try:
+                        session_config = config_utils.get_session_config(self.session_name, CONFIG_PATH)
+                        if not await self.check_and_update_proxy(session_config):
+                            logger.warning('Failed to find working proxy. Sleep 5 minutes.')
+                            await asyncio.sleep(300)
+                            continue
 
-                    await self.process_bot_logic()
+                        await self.process_bot_logic()
 
-                except InvalidSession as e:
-                    raise
-                except Exception as error:
-                    sleep_duration = uniform(60, 120)
-                    logger.error(f"Unknown error: {error}. Sleeping for {int(sleep_duration)}")
-                    await asyncio.sleep(sleep_duration)
+                    except InvalidSession as e:
+                        raise
+                    except Exception as error:
+                        sleep_duration = uniform(60, 120)
+                        logger.error(f"Unknown error: {error}. Sleeping for {int(sleep_duration)}")
+                        await asyncio.sleep(sleep_duration)
+            finally:
+                await self._close_proxy_connectors()
 
     async def process_bot_logic(self) -> None:
         access_token_created_time = 0
@@ -201,7 +328,7 @@ class BaseBot:
             try:
                 if time() - access_token_created_time >= 3600:
                     tg_web_data = await self.get_tg_web_data()
-                    self._access_token = await self.login(tg_web_data=tg_web_data)
+                    self._set_access_token(await self.login(tg_web_data=tg_web_data))
                     access_token_created_time = time()
 
                     if self._is_first_run:
@@ -210,7 +337,7 @@ class BaseBot:
                         try:
                             response = await self.make_request(
                                 method='POST',
-                                url=f'https://bi.yescoin.gold/invite/claimGiftBox?packId={ref_id}'
+                                url=f'{_URL.CLAIM_GIFT_BOX}?packId={ref_id}'
                             )
 
                             if response and response.get('code') == 0:
@@ -228,20 +355,26 @@ class BaseBot:
                         except Exception as e:
                             logger.error(f"{self.session_name} | ❌ Error activating referral code: {e}")
 
-                    await self.process_offline_bonus()
-                    await self.process_signin()
-                    await self.process_squad()
-
-                    profile_data = await self.get_profile_data()
-                    if not profile_data:
+                    # The bootstrap endpoints are independent; run them on the
+                    # keep-alive pool concurrently instead of serially.
+                    _, _, _, profile_data, tge_status = await asyncio.gather(
+                        self.process_offline_bonus(),
+                        self.process_signin(),
+                        self.process_squad(),
+                        self.get_profile_data(),
+                        self.get_activity_status("TGE"),
+                        return_exceptions=True
+                    )
+                    if isinstance(profile_data, Exception) or not profile_data:
                         continue
+                    if isinstance(tge_status, Exception):
+                        tge_status = {}
 
                     balance = profile_data['currentAmount']
                     rank = profile_data['rank']
                     level = profile_data['userLevel']
                     invite_amount = profile_data['inviteAmount']
 
-                    tge_status = await self.get_activity_status("TGE")
                     if tge_status:
                         join_status = tge_status.get('joinStatus', 0)
                         days_in_game = tge_status.get('joinYesDays', 0)
@@ -278,7 +411,10 @@ class BaseBot:
                     )
 
                 try:
-                    game_data = await self.get_game_data()
+                    game_data, boosts_info = await asyncio.gather(
+                        self.get_game_data(),
+                        self.get_boosts_info()
+                    )
                     if not game_data:
                         sleep_time = randint(settings.SLEEP_BY_MIN_ENERGY[0], settings.SLEEP_BY_MIN_ENERGY[1])
                         logger.warning(
@@ -295,7 +431,6 @@ class BaseBot:
                     energy_recovery_rate = game_data.get('coinPoolRecoverySpeed', 0)
                     min_energy = int(total_energy * settings.MIN_AVAILABLE_ENERGY / 100)
 
-                    boosts_info = await self.get_boosts_info()
                     if not boosts_info:
                         sleep_time = randint(settings.SLEEP_BY_MIN_ENERGY[0], settings.SLEEP_BY_MIN_ENERGY[1])
                         logger.warning(
@@ -329,9 +464,8 @@ class BaseBot:
                         if tap_data is None:
                             sleep_time = randint(settings.SLEEP_BY_MIN_ENERGY[0], settings.SLEEP_BY_MIN_ENERGY[1])
                             logger.warning(
-                                f"{self.session_name} | "
-                                f"⚠️ Too many requests | "
-                                f"⏳ Waiting {format_duration(sleep_time)}"
+                                "{} | ⚠️ Too many requests | ⏳ Waiting {}",
+                                self.session_name, format_duration(sleep_time)
                             )
                             await asyncio.sleep(sleep_time)
                             continue
@@ -341,7 +475,8 @@ class BaseBot:
                                 new_balance = tap_data['current_amount']
                                 total = tap_data['total_amount']
                             else:
-                                profile_data = await self.get_profile_data()
+                                profile_data = self._prefetched_profile or await self.get_profile_data()
+                                self._prefetched_profile = None
                                 if not profile_data:
                                     available_energy = 0
                                     continue
@@ -360,12 +495,13 @@ class BaseBot:
                             available_energy = game_data['coinPoolLeftCount']
                             total_energy = game_data.get('coinPoolTotalCount', 0)
 
+                            # Brace-style args defer the string build to loguru,
+                            # which skips it entirely for filtered levels.
                             logger.success(
-                                f"{self.session_name} | "
-                                f"{'🚀 Turbo tap' if active_turbo else '👆 Regular tap'} | "
-                                f"💰 Collected: {collect_amount} | "
-                                f"💵 Balance: {balance} | "
-                                f"⚡️ Energy: {available_energy}/{total_energy}"
+                                "{} | {} | 💰 Collected: {} | 💵 Balance: {} | ⚡️ Energy: {}/{}",
+                                self.session_name,
+                                '🚀 Turbo tap' if active_turbo else '👆 Regular tap',
+                                collect_amount, balance, available_energy, total_energy
                             )
 
                             await asyncio.sleep(randint(a=settings.SLEEP_BETWEEN_TAP[0], b=settings.SLEEP_BETWEEN_TAP[1]))
@@ -373,61 +509,41 @@ class BaseBot:
 
                     if available_energy == 0:
                         try:
-                            next_tap_level = boosts_info['singleCoinLevel'] + 1
-                            next_energy_level = boosts_info['coinPoolTotalLevel'] + 1
-                            next_charge_level = boosts_info['coinPoolRecoveryLevel'] + 1
-                            next_yespac_level = boosts_info['yesPacLevel'] + 1
-
-                            next_tap_price = boosts_info['singleCoinUpgradeCost']
-                            next_energy_price = boosts_info['coinPoolTotalUpgradeCost']
-                            next_charge_price = boosts_info['coinPoolRecoveryUpgradeCost']
-                            next_yespac_price = boosts_info['yesPacUpgradeCost']
+                            upgrade_specs = (
+                                (4, '🔄', 'YESPAC', 'YESPAC', boosts_info['yesPacLevel'] + 1,
+                                 boosts_info['yesPacUpgradeCost'], settings.MAX_YESPAC_LEVEL),
+                                (1, '💰', 'tap', 'Tap', boosts_info['singleCoinLevel'] + 1,
+                                 boosts_info['singleCoinUpgradeCost'], settings.MAX_TAP_LEVEL),
+                                (3, '⚡️', 'energy', 'Energy', boosts_info['coinPoolTotalLevel'] + 1,
+                                 boosts_info['coinPoolTotalUpgradeCost'], settings.MAX_ENERGY_LEVEL),
+                                (2, '⏱', 'recovery', 'Recovery', boosts_info['coinPoolRecoveryLevel'] + 1,
+                                 boosts_info['coinPoolRecoveryUpgradeCost'], settings.MAX_CHARGE_LEVEL),
+                            )
+                            todo = [spec for spec in upgrade_specs
+                                    if balance >= spec[5] and spec[4] <= spec[6]]
 
                             upgraded = False
-
-                            if balance >= next_yespac_price and next_yespac_level <= settings.MAX_YESPAC_LEVEL:
-                                logger.info(
-                                    f"{self.session_name} | "
-                                    f"🔄 Upgrading YESPAC to level {next_yespac_level} | "
-                                    f"Price: {next_yespac_price} | "
-                                    f"Max: {settings.MAX_YESPAC_LEVEL}"
+                            if todo:
+                                for _, icon, name, _, next_level, price, max_level in todo:
+                                    logger.info(
+                                        "{} | {} Upgrading {} to level {} | Price: {} | Max: {}",
+                                        self.session_name, icon, name, next_level, price, max_level
+                                    )
+
+                                # The server treats the upgrades independently,
+                                # so dispatch them in one round-trip instead of
+                                # three or four serial ones.
+                                results = await asyncio.gather(
+                                    *[self.level_up(boost_id=spec[0]) for spec in todo],
+                                    return_exceptions=True
                                 )
-                                if await self.level_up(boost_id=4):
-                                    logger.success(f"{self.session_name} | ✅ YESPAC upgraded to level {next_yespac_level}")
-                                    upgraded = True
-
-                            if balance >= next_tap_price and next_tap_level <= settings.MAX_TAP_LEVEL:
-                                logger.info(
-                                    f"{self.session_name} | "
-                                    f"💰 Upgrading tap to level {next_tap_level} | "
-                                    f"Price: {next_tap_price} | "
-                                    f"Max: {settings.MAX_TAP_LEVEL}"
-                                )
-                                if await self.level_up(boost_id=1):
-                                    logger.success(f"{self.session_name} | ✅ Tap upgraded to level {next_tap_level}")
-                                    upgraded = True
-
-                            if balance >= next_energy_price and next_energy_level <= settings.MAX_ENERGY_LEVEL:
-                                logger.info(
-                                    f"{self.session_name} | "
-                                    f"⚡️ Upgrading energy to level {next_energy_level} | "
-                                    f"Price: {next_energy_price} | "
-                                    f"Max: {settings.MAX_ENERGY_LEVEL}"
-                                )
-                                if await self.level_up(boost_id=3):
-                                    logger.success(f"{self.session_name} | ✅ Energy upgraded to level {next_energy_level}")
-                                    upgraded = True
-
-                            if balance >= next_charge_price and next_charge_level <= settings.MAX_CHARGE_LEVEL:
-                                logger.info(
-                                    f"{self.session_name} | "
-                                    f"⏱ Upgrading recovery to level {next_charge_level} | "
-                                    f"Price: {next_charge_price} | "
-                                    f"Max: {settings.MAX_CHARGE_LEVEL}"
-                                )
-                                if await self.level_up(boost_id=2):
-                                    logger.success(f"{self.session_name} | ✅ Recovery upgraded to level {next_charge_level}")
-                                    upgraded = True
+                                for spec, result in zip(todo, results):
+                                    if isinstance(result, TooManyRequestsError):
+                                        raise result
+                                    if result is True:
+                                        logger.success("{} | ✅ {} upgraded to level {}",
+                                                       self.session_name, spec[3], spec[4])
+                                        upgraded = True
 
                             if upgraded:
                                 await asyncio.sleep(1)
@@ -436,28 +552,24 @@ class BaseBot:
                         except TooManyRequestsError:
                             sleep_time = randint(settings.SLEEP_BY_MIN_ENERGY[0], settings.SLEEP_BY_MIN_ENERGY[1])
                             logger.warning(
-                                f"{self.session_name} | "
-                                f"⚠️ Too many requests while upgrading | "
-                                f"⏳ Waiting {format_duration(sleep_time)}"
+                                "{} | ⚠️ Too many requests while upgrading | ⏳ Waiting {}",
+                                self.session_name, format_duration(sleep_time)
                             )
                             await asyncio.sleep(sleep_time)
                             continue
 
                         sleep_time = randint(settings.SLEEP_BY_MIN_ENERGY[0], settings.SLEEP_BY_MIN_ENERGY[1])
                         logger.info(
-                            f"{self.session_name} | "
-                            f"⚡️ Energy is out | "
-                            f"💰 Balance: {balance} | "
-                            f"⏳ Waiting {format_duration(sleep_time)}"
+                            "{} | ⚡️ Energy is out | 💰 Balance: {} | ⏳ Waiting {}",
+                            self.session_name, balance, format_duration(sleep_time)
                         )
                         await asyncio.sleep(sleep_time)
 
                 except TooManyRequestsError:
                     sleep_time = randint(settings.SLEEP_BY_MIN_ENERGY[0], settings.SLEEP_BY_MIN_ENERGY[1])
                     logger.warning(
-                        f"{self.session_name} | "
-                        f"⚠️ Too many requests | "
-                        f"⏭ Waiting {format_duration(sleep_time)}"
+                        "{} | ⚠️ Too many requests | ⏭ Waiting {}",
+                        self.session_name, format_duration(sleep_time)
                     )
                     await asyncio.sleep(sleep_time)
                     continue
@@ -475,9 +587,8 @@ class BaseBot:
 
             response = await self.make_request(
                 method='POST',
-                url='https://bi.yescoin.gold/user/login',
-                json=request_data,
-                headers=HEADERS
+                url=_URL.LOGIN,
+                json=request_data
             )
 
             if not response:
@@ -490,7 +601,7 @@ class BaseBot:
                 raise InvalidSession("Authorization error: invalid response format")
 
             token = response['data']['token']
-            self._access_token = token
+            self._set_access_token(token)
             logger.success(f"{self.session_name} | Successful authorization")
             return token
 
@@ -499,293 +610,191 @@ class BaseBot:
             await asyncio.sleep(3)
             raise InvalidSession("Authorization error")
 
-    async def get_profile_data(self) -> Dict[str, Any]:
+    async def _get_data(self, url: str, label: str, default: Any = None) -> Any:
         try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/account/getAccountInfo'
-            )
-            return response['data'] if response else {}
+            response = await self.make_request(method='GET', url=url)
+            if response:
+                return response['data']
         except TooManyRequestsError:
             raise
         except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving profile data: {error}")
-            await asyncio.sleep(3)
-            return {}
-
-    async def get_game_data(self) -> Dict[str, Any]:
+            # Idempotent GET: the caller just falls back to the default, so
+            # there is nothing to wait for before returning it.
+            logger.error(f"{self.session_name} | Error {label}: {error}")
+        return {} if default is None else default
+
+    async def _cached_get(self, url: str, label: str, ttl: float = 45, default: Any = None) -> Any:
+        # Short-TTL cache for read-only lists that barely change within one
+        # run() iteration; writers invalidate via self._get_cache.pop(url).
+        cached = self._get_cache.get(url)
+        now = monotonic()
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        data = await self._get_data(url, label, default=default)
+        self._get_cache[url] = (now, data)
+        return data
+
+    async def _post_bool(self, url: str, label: str, json: Any = None) -> bool:
         try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/game/getGameInfo'
-            )
-            return response['data'] if response else {}
+            kwargs = {'json': json} if json is not None else {}
+            response = await self.make_request(method='POST', url=url, **kwargs)
+            return bool(response and response['data'])
         except TooManyRequestsError:
             raise
         except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving game data: {error}")
+            logger.error(f"{self.session_name} | Error {label}: {error}")
             await asyncio.sleep(3)
-            return {}
+            return False
 
-    async def get_boosts_info(self) -> Dict[str, Any]:
+    async def _post_data(self, url: str, label: str, json: Any = None,
+                         invalidate: Optional[str] = None) -> Dict[str, Any]:
+        # POST counterpart of _get_data: returns response['data'] (or {}) and
+        # optionally drops a _cached_get entry once the write succeeded.
         try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/build/getAccountBuildInfo'
-            )
-            return response['data'] if response else {}
+            kwargs = {'json': json} if json is not None else {}
+            response = await self.make_request(method='POST', url=url, **kwargs)
+            if response and response.get('data'):
+                if invalidate is not None:
+                    self._get_cache.pop(invalidate, None)
+                return response['data']
+            return {}
         except TooManyRequestsError:
             raise
         except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving boost information: {error}")
+            logger.error(f"{self.session_name} | Error {label}: {error}")
             await asyncio.sleep(3)
             return {}
 
+    async def get_profile_data(self) -> Dict[str, Any]:
+        return await self._get_data(_URL.PROFILE, "retrieving profile data")
+
+    async def get_game_data(self) -> Dict[str, Any]:
+        return await self._get_data(_URL.GAME_INFO, "retrieving game data")
+
+    async def get_boosts_info(self) -> Dict[str, Any]:
+        return await self._get_data(_URL.BUILD_INFO, "retrieving boost information")
+
     async def get_special_box_info(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/game/getSpecialBoxInfo'
-            )
-            return response['data'] if response else {}
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving special box information: {error}")
-            await asyncio.sleep(3)
-            return {}
+        return await self._get_data(_URL.SPECIAL_BOX_INFO, "retrieving special box information")
 
     async def level_up(self, boost_id: int) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/build/levelUp',
-                json=str(boost_id)
-            )
-            return bool(response and response['data'])
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error leveling up boost {boost_id}: {error}")
-            await asyncio.sleep(3)
-            return False
+        return await self._post_bool(_URL.LEVEL_UP, f"leveling up boost {boost_id}", json=str(boost_id))
 
     async def apply_turbo_boost(self) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/game/recoverSpecialBox'
-            )
-            return bool(response and response['data'])
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error applying turbo boost: {error}")
-            await asyncio.sleep(3)
-            return False
+        return await self._post_bool(_URL.RECOVER_SPECIAL_BOX, "applying turbo boost")
 
     async def apply_energy_boost(self) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/game/recoverCoinPool'
-            )
-            return bool(response and response['data'])
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error applying energy boost: {error}")
-            await asyncio.sleep(3)
-            return False
+        return await self._post_bool(_URL.RECOVER_COIN_POOL, "applying energy boost")
 
+    @_safe("Error sending taps", default=(False, {}))
     async def send_taps(self, taps: int) -> Tuple[bool, Dict[str, Any]]:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/game/collectCoin',
-                json=str(taps)
-            )
-            if not response or not response['data']:
-                return False, {}
-
-            data = response['data']
-            return data['collectStatus'], {
-                'collect_amount': data['collectAmount'],
-                'current_amount': data['currentAmount'],
-                'total_amount': data['totalAmount']
-            }
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error sending taps: {error}")
-            await asyncio.sleep(3)
+        response = await self.make_request(
+            method='POST',
+            url=_URL.COLLECT_COIN,
+            json=str(taps)
+        )
+        if not response or not response['data']:
             return False, {}
 
-    async def send_taps_with_turbo(self) -> Tuple[bool, Dict[str, Any]]:
-        try:
-            special_box_info = await self.get_special_box_info()
-            box_type = special_box_info['recoveryBox']['boxType']
-            taps = special_box_info['recoveryBox']['specialBoxTotalCount']
-
-            await asyncio.sleep(10)
+        data = response['data']
+        return data['collectStatus'], {
+            'collect_amount': data['collectAmount'],
+            'current_amount': data['currentAmount'],
+            'total_amount': data['totalAmount']
+        }
 
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/game/collectSpecialBoxCoin',
-                json={'boxType': box_type, 'coinCount': taps}
-            )
-            if not response or not response['data']:
-                return False, {}
-
-            data = response['data']
-            return data['collectStatus'], {
-                'collect_amount': data['collectAmount'],
-                'current_amount': data.get('currentAmount'),
-                'total_amount': data.get('totalAmount')
-            }
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error sending taps with turbo: {error}")
-            await asyncio.sleep(3)
+    @_safe("Error sending taps with turbo", default=(False, {}))
+    async def send_taps_with_turbo(self) -> Tuple[bool, Dict[str, Any]]:
+        special_box_info = await self.get_special_box_info()
+        box_type = special_box_info['recoveryBox']['boxType']
+        taps = special_box_info['recoveryBox']['specialBoxTotalCount']
+
+        # Overlap the pre-collect delay with a speculative profile fetch;
+        # the caller consumes it when the turbo response lacks balances.
+        _, self._prefetched_profile = await asyncio.gather(
+            asyncio.sleep(10),
+            self.get_profile_data()
+        )
+
+        response = await self.make_request(
+            method='POST',
+            url=_URL.COLLECT_SPECIAL_BOX_COIN,
+            json={'boxType': box_type, 'coinCount': taps}
+        )
+        if not response or not response['data']:
             return False, {}
 
+        data = response['data']
+        return data['collectStatus'], {
+            'collect_amount': data['collectAmount'],
+            'current_amount': data.get('currentAmount'),
+            'total_amount': data.get('totalAmount')
+        }
+
     async def get_user_info(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/user/info'
-            )
-            return response['data'] if response else {}
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving user information: {error}")
-            await asyncio.sleep(3)
-            return {}
+        return await self._get_data(_URL.USER_INFO, "retrieving user information")
 
     async def get_user_active_level(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/activity/userActiveLevel'
-            )
-            return response['data'] if response else {}
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving active level: {error}")
-            await asyncio.sleep(3)
-            return {}
+        return await self._get_data(_URL.USER_ACTIVE_LEVEL, "retrieving active level")
 
     async def get_stop_bonus(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/account/getUserStopBonus'
-            )
-            return response['data'] if response else {}
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving bonus information: {error}")
-            await asyncio.sleep(3)
-            return {}
+        return await self._get_data(_URL.STOP_BONUS, "retrieving bonus information")
 
     async def claim_stop_bonus(self) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/account/claimStopBonus'
-            )
-            return bool(response and response['data'])
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error claiming bonus: {error}")
-            await asyncio.sleep(3)
-            return False
+        return await self._post_bool(_URL.CLAIM_STOP_BONUS, "claiming bonus")
 
     async def join_activity(self, activity_code: str) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/activity/doJoinActivity',
-                json={"activityCode": activity_code}
-            )
-            return bool(response and response['data'])
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error joining activity: {error}")
-            await asyncio.sleep(3)
-            return False
+        return await self._post_bool(
+            _URL.JOIN_ACTIVITY,
+            "joining activity",
+            json={"activityCode": activity_code}
+        )
 
     async def get_activity_status(self, activity_code: str) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url=f'https://bi.yescoin.gold/activity/getJoinActivityStatus?activityCode={activity_code}'
-            )
-            return response['data'] if response else {}
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving activity status: {error}")
-            await asyncio.sleep(3)
-            return {}
-
-    async def check_proxy(self, proxy: Proxy) -> None:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://httpbin.org/ip',
-                timeout=aiohttp.ClientTimeout(5)
-            )
-            if response:
-                ip = response.get('origin')
-                logger.info(f"{self.session_name} | Proxy IP: {ip}")
-        except Exception as error:
-            logger.error(f"{self.session_name} | Proxy: {proxy} | Error: {error}")
+        return await self._get_data(
+            f'{_URL.ACTIVITY_STATUS}?activityCode={activity_code}',
+            "retrieving activity status"
+        )
 
     async def get_task_list(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/task/getTaskList'
-            )
-            return response['data'] if response else {}
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving task list: {error}")
-            await asyncio.sleep(3)
-            return {}
+        return await self._cached_get(_URL.TASK_LIST, "retrieving task list")
 
     async def click_task(self, task_id: str) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/task/clickTask',
-                json=task_id
-            )
-            return bool(response and response['data'])
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error clicking task {task_id}: {error}")
-            await asyncio.sleep(3)
-            return False
+        return await self._post_bool(_URL.CLICK_TASK, f"clicking task {task_id}", json=task_id)
 
     async def check_task(self, task_id: str) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/task/checkTask',
-                json=task_id
-            )
-            return bool(response and response['data'])
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error checking task {task_id}: {error}")
-            await asyncio.sleep(3)
-            return False
+        return await self._post_bool(_URL.CHECK_TASK, f"checking task {task_id}", json=task_id)
 
     async def claim_task_reward(self, task_id: str) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/task/claimTaskReward',
-                json=task_id
-            )
-            return response['data'] if response else {}
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error claiming reward for task {task_id}: {error}")
-            await asyncio.sleep(3)
-            return {}
+        return await self._post_data(_URL.CLAIM_TASK_REWARD, f"claiming reward for task {task_id}",
+                                     json=task_id, invalidate=_URL.TASK_LIST)
 
     async def get_task_bonus_info(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/task/getFinishTaskBonusInfo'
-            )
-            return response['data'] if response else {}
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving bonus information: {error}")
-            await asyncio.sleep(3)
-            return {}
+        return await self._cached_get(_URL.TASK_BONUS_INFO, "retrieving bonus information", ttl=30)
+
+    async def _run_task(self, task: Dict[str, Any], special: bool = False) -> bool:
+        task_id, task_name, task_bonus = _TASK_FIELDS(task)
+
+        if not special:
+            logger.info("{} | Executing task: {} | Reward: {}",
+                        self.session_name, task_name, task_bonus)
+
+        if not await self.click_task(task_id):
+            return False
+        await asyncio.sleep(5)
+        if not await self.check_task(task_id):
+            return False
+        reward_data = await self.claim_task_reward(task_id)
+        if not reward_data:
+            return False
+
+        if special:
+            logger.success("{} | ✅ Special task {} completed | 💰 Received: {}",
+                           self.session_name, task_name, reward_data.get('bonusAmount', 0))
+        else:
+            logger.success("{} | Task {} completed | Received: {}",
+                           self.session_name, task_name, reward_data.get('bonusAmount', 0))
+        return True
 
     async def process_tasks(self) -> None:
         try:
@@ -796,49 +805,26 @@ class BaseBot:
             daily_tasks_completed = 0
             daily_tasks_total = 0
 
-            for task in task_list.get('taskList', []):
-                task_id = task['taskId']
-                task_name = task['taskName']
-                task_bonus = task['taskBonusAmount']
-                task_status = task['taskStatus']
-
-                if task_status == 0:
-                    logger.info(
-                        f"{self.session_name} | "
-                        f"Executing task: {task_name} | "
-                        f"Reward: {task_bonus}"
-                    )
-
-                    if await self.click_task(task_id):
-                        await asyncio.sleep(5)
-                        if await self.check_task(task_id):
-                            reward_data = await self.claim_task_reward(task_id)
-                            if reward_data:
-                                logger.success(
-                                    f"{self.session_name} | "
-                                    f"Task {task_name} completed | "
-                                    f"Received: {reward_data.get('bonusAmount', 0)}"
-                                )
-                                daily_tasks_completed += 1
+            pending = [(task, False) for task in task_list.get('taskList', []) if task['taskStatus'] == 0]
+            pending += [(task, True) for task in task_list.get('specialTaskList', []) if task['taskStatus'] == 0]
 
-            for task in task_list.get('specialTaskList', []):
-                task_id = task['taskId']
-                task_name = task['taskName']
-                task_bonus = task['taskBonusAmount']
-                task_status = task['taskStatus']
+            if pending:
+                # Each click/check/claim pipeline is independent, so run them
+                # concurrently; the semaphore keeps us within per-host limits.
+                semaphore = asyncio.Semaphore(4)
 
-                if task_status == 0:
+                async def bounded(task: Dict[str, Any], special: bool) -> bool:
+                    async with semaphore:
+                        return await self._run_task(task, special=special)
 
-                    if await self.click_task(task_id):
-                        await asyncio.sleep(5)
-                        if await self.check_task(task_id):
-                            reward_data = await self.claim_task_reward(task_id)
-                            if reward_data:
-                                logger.success(
-                                    f"{self.session_name} | "
-                                    f"✅ Special task {task_name} completed | "
-                                    f"💰 Received: {reward_data.get('bonusAmount', 0)}"
-                                )
+                results = await asyncio.gather(
+                    *[bounded(task, special) for task, special in pending],
+                    return_exceptions=True
+                )
+                daily_tasks_completed = sum(
+                    1 for (_, special), result in zip(pending, results)
+                    if result is True and not special
+                )
 
             bonus_info = await self.get_task_bonus_info()
             if bonus_info:
@@ -855,19 +841,9 @@ class BaseBot:
 
         except Exception as error:
             logger.error(f"{self.session_name} | Error processing tasks: {error}")
-            await asyncio.sleep(3)
 
     async def get_daily_missions(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/mission/getDailyMission'
-            )
-            return response['data'] if response else []
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving daily missions: {error}")
-            await asyncio.sleep(3)
-            return []
+        return await self._cached_get(_URL.DAILY_MISSIONS, "retrieving daily missions", default=[])
 
     async def process_daily_mission(self, mission_id: int) -> bool:
         try:
@@ -878,7 +854,7 @@ class BaseBot:
 
                 click_response = await self.make_request(
                     method='POST',
-                    url='https://bi.yescoin.gold/mission/clickDailyMission',
+                    url=_URL.CLICK_DAILY_MISSION,
                     json=mission_id
                 )
                 if not click_response or not click_response['data']:
@@ -889,7 +865,7 @@ class BaseBot:
 
                 check_response = await self.make_request(
                     method='POST',
-                    url='https://bi.yescoin.gold/mission/checkDailyMission',
+                    url=_URL.CHECK_DAILY_MISSION,
                     json=mission_id
                 )
                 if not check_response or not check_response['data']:
@@ -900,7 +876,7 @@ class BaseBot:
 
                 claim_response = await self.make_request(
                     method='POST',
-                    url='https://bi.yescoin.gold/mission/claimReward',
+                    url=_URL.CLAIM_MISSION_REWARD,
                     json=mission_id
                 )
                 if not claim_response or not claim_response.get('data'):
@@ -909,10 +885,9 @@ class BaseBot:
 
                 reward_data = claim_response['data']
                 logger.success(
-                    f"{self.session_name} | ✅ Mission completed | "
-                    f"💰 Reward: {reward_data.get('reward', 0)} | "
-                    f"⭐️ Points: {reward_data.get('score', 0)} | "
-                    f"🔄 Attempt: {attempt + 1}"
+                    "{} | ✅ Mission completed | 💰 Reward: {} | ⭐️ Points: {} | 🔄 Attempt: {}",
+                    self.session_name, reward_data.get('reward', 0),
+                    reward_data.get('score', 0), attempt + 1
                 )
                 return True
 
@@ -921,7 +896,6 @@ class BaseBot:
 
         except Exception as error:
             logger.error(f"{self.session_name} | ❌ Error processing mission {mission_id}: {error}")
-            await asyncio.sleep(3)
             return False
 
     async def process_daily_missions(self) -> None:
@@ -933,28 +907,29 @@ class BaseBot:
 
             logger.info(f"{self.session_name} | 📋 Starting daily missions...")
 
-            completed = 0
-            failed = 0
             total = len(missions)
+            pending_missions = [mission for mission in missions if mission['missionStatus'] == 0]
+            completed = total - len(pending_missions)
+            failed = 0
 
-            for mission in missions:
-                mission_id = mission['missionId']
-                mission_name = mission['name']
-                mission_status = mission['missionStatus']
-                mission_reward = mission['reward']
+            if pending_missions:
+                semaphore = asyncio.Semaphore(4)
 
-                if mission_status == 0:
-                    try:
-                        if await self.process_daily_mission(mission_id):
-                            completed += 1
-                        else:
-                            failed += 1
-                        await asyncio.sleep(5)
-                    except Exception as e:
-                        logger.warning(f"{self.session_name} | ⏭️ Skipping mission {mission_name}: {str(e)}")
+                async def bounded(mission: Dict[str, Any]) -> bool:
+                    async with semaphore:
+                        return await self.process_daily_mission(mission['missionId'])
+
+                results = await asyncio.gather(
+                    *[bounded(mission) for mission in pending_missions],
+                    return_exceptions=True
+                )
+                for mission, result in zip(pending_missions, results):
+                    if result is True:
+                        completed += 1
+                    else:
+                        if isinstance(result, Exception):
+                            logger.warning(f"{self.session_name} | ⏭️ Skipping mission {mission['name']}: {result}")
                         failed += 1
-                else:
-                    completed += 1
 
             logger.info(
                 f"{self.session_name} | "
@@ -964,56 +939,33 @@ class BaseBot:
 
         except Exception as error:
             logger.warning(f"{self.session_name} | ⏭️ Skipping missions: {error}")
-            await asyncio.sleep(3)
 
     async def get_squad_info(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/squad/mySquad'
-            )
-            return response['data'] if response else {}
-        except Exception as error:
-            logger.error(f"{self.session_name} | ❌ Error retrieving squad information: {error}")
-            await asyncio.sleep(3)
-            return {}
+        return await self._get_data(_URL.MY_SQUAD, "retrieving squad information")
 
     async def get_recommended_squads(self) -> List[Dict[str, Any]]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/squad/getRecommendSquadList'
-            )
-            return response['data']['list'] if response and 'data' in response else []
-        except Exception as error:
-            logger.error(f"{self.session_name} | ❌ Error retrieving squad list: {error}")
-            await asyncio.sleep(3)
-            return []
+        data = await self._get_data(_URL.RECOMMEND_SQUADS, "retrieving squad list")
+        return data.get('list', []) if data else []
 
+    @_safe("❌ Error joining squad", default=False)
     async def join_squad(self, squad_id: str, squad_tg_link: str) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/squad/joinSquad',
-                json={
-                    "squadId": squad_id,
-                    "squadTgLink": squad_tg_link
-                }
+        response = await self.make_request(
+            method='POST',
+            url=_URL.JOIN_SQUAD,
+            json={
+                "squadId": squad_id,
+                "squadTgLink": squad_tg_link
+            }
+        )
+        if response and response.get('code') == 0:
+            squad_info = response['data']['squadInfo']
+            logger.success(
+                "{} | ✅ Joined squad {} | 👥 Members: {} | 📊 Level: {}",
+                self.session_name, squad_info['squadTitle'],
+                squad_info['squadMembers'], squad_info['squadLevel']
             )
-            if response and response.get('code') == 0:
-                squad_info = response['data']['squadInfo']
-                logger.success(
-                    f"{self.session_name} | "
-                    f"✅ Joined squad {squad_info['squadTitle']} | "
-                    f"👥 Members: {squad_info['squadMembers']} | "
-                    f"📊 Level: {squad_info['squadLevel']}"
-                )
-                return True
-            return False
-        except Exception as error:
-            logger.error(f"{self.session_name} | ❌ Error joining squad: {error}")
-            await asyncio.sleep(3)
-            return False
+            return True
+        return False
 
     async def process_squad(self) -> None:
         try:
@@ -1026,103 +978,71 @@ class BaseBot:
             if not squads:
                 return
 
+            # joinSquad is not idempotent — firing the attempts concurrently
+            # could land the account in several squads. Keep them serial (the
+            # old 2-second pad between attempts is gone; the round-trip itself
+            # is pacing enough) and stop at the first success.
             for squad in squads[:3]:
-                squad_id = squad['squadIdStr']
-                squad_tg_link = squad['squadTgLink']
-                squad_title = squad['squadTitle']
-                squad_members = squad['squadMembers']
-
-                logger.info(
-                    f"{self.session_name} | "
-                    f"🎯 Trying to join squad {squad_title} | "
-                    f"👥 Members: {squad_members}"
-                )
+                logger.info("{} | 🎯 Trying to join squad {} | 👥 Members: {}",
+                            self.session_name, squad['squadTitle'], squad['squadMembers'])
 
-                if await self.join_squad(squad_id, squad_tg_link):
+                if await self.join_squad(squad['squadIdStr'], squad['squadTgLink']):
                     break
 
-                await asyncio.sleep(2)
-
         except Exception as error:
             logger.error(f"{self.session_name} | ❌ Error processing squad: {error}")
             await asyncio.sleep(3)
 
     async def get_offline_bonus_info(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/game/getOfflineYesPacBonusInfo'
-            )
-            return response['data'] if response else []
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving offline bonus info: {error}")
-            await asyncio.sleep(3)
-            return []
+        return await self._get_data(_URL.OFFLINE_BONUS_INFO, "retrieving offline bonus info", default=[])
 
+    @_safe("Error claiming offline bonus", default=False)
     async def claim_offline_bonus(self, transaction_id: str, claim_type: int, create_at: int) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/game/claimOfflineBonus',
-                json={
-                    "id": transaction_id,
-                    "createAt": create_at,
-                    "claimType": claim_type,
-                    "destination": ""
-                }
+        response = await self.make_request(
+            method='POST',
+            url=_URL.CLAIM_OFFLINE_BONUS,
+            json={
+                "id": transaction_id,
+                "createAt": create_at,
+                "claimType": claim_type,
+                "destination": ""
+            }
+        )
+        if response and response.get('code') == 0:
+            bonus_data = response['data']
+            logger.success(
+                f"{self.session_name} | "
+                f"✅ Claimed offline bonus | "
+                f"💰 Amount: {bonus_data['collectAmount']} | "
+                f"📊 Extra: {bonus_data['extraPercentage']}%"
             )
-            if response and response.get('code') == 0:
-                bonus_data = response['data']
-                logger.success(
-                    f"{self.session_name} | "
-                    f"✅ Claimed offline bonus | "
-                    f"💰 Amount: {bonus_data['collectAmount']} | "
-                    f"📊 Extra: {bonus_data['extraPercentage']}%"
-                )
-                return True
-            return False
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error claiming offline bonus: {error}")
-            await asyncio.sleep(3)
-            return False
+            return True
+        return False
 
     async def get_signin_list(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/signIn/list'
-            )
-            return response['data'] if response else []
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error retrieving signin list: {error}")
-            await asyncio.sleep(3)
-            return []
+        return await self._cached_get(_URL.SIGNIN_LIST, "retrieving signin list", default=[])
 
+    @_safe("Error claiming signin reward", default=False)
     async def claim_signin(self, signin_id: str, create_at: int, signin_type: int = 1) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/signIn/claim',
-                json={
-                    "id": signin_id,
-                    "createAt": create_at,
-                    "signInType": signin_type,
-                    "destination": ""
-                }
+        response = await self.make_request(
+            method='POST',
+            url=_URL.CLAIM_SIGNIN,
+            json={
+                "id": signin_id,
+                "createAt": create_at,
+                "signInType": signin_type,
+                "destination": ""
+            }
+        )
+        if response and response.get('code') == 0:
+            reward_data = response['data']
+            logger.success(
+                f"{self.session_name} | "
+                f"✅ Daily check-in completed | "
+                f"💰 Reward: {reward_data['reward']}"
             )
-            if response and response.get('code') == 0:
-                reward_data = response['data']
-                logger.success(
-                    f"{self.session_name} | "
-                    f"✅ Daily check-in completed | "
-                    f"💰 Reward: {reward_data['reward']}"
-                )
-                return True
-            return False
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error claiming signin reward: {error}")
-            await asyncio.sleep(3)
-            return False
+            return True
+        return False
 
     async def process_offline_bonus(self) -> None:
         try:
@@ -1142,9 +1062,10 @@ class BaseBot:
             if not wallet_address:
                 return
 
+            # One timestamp for the whole batch of claims.
+            create_at = int(time())
             for bonus in bonus_info:
                 if bonus['collectStatus']:
-                    create_at = int(time())
                     bonus_data = {
                         "id": bonus['transactionId'],
                         "createAt": create_at,
@@ -1154,18 +1075,16 @@ class BaseBot:
 
                     response = await self.make_request(
                         method='POST',
-                        url='https://bi.yescoin.gold/game/claimOfflineBonus',
+                        url=_URL.CLAIM_OFFLINE_BONUS,
                         json=bonus_data
                     )
 
                     if response and response.get('code') == 0:
                         logger.success(
-                            f"{self.session_name} | "
-                            f"✅ Offline bonus claimed | "
-                            f"💰 Amount: {bonus['collectAmount']} | "
-                            f"📈 Extra: {bonus['extraPercentage']}%"
+                            "{} | ✅ Offline bonus claimed | 💰 Amount: {} | 📈 Extra: {}%",
+                            self.session_name, bonus['collectAmount'], bonus['extraPercentage']
                         )
-                    await asyncio.sleep(1)
+                    await asyncio.sleep(0)
 
         except Exception as error:
             logger.error(f"{self.session_name} | Error processing offline bonus: {error}")
@@ -1177,9 +1096,9 @@ class BaseBot:
             if not signin_list:
                 return
 
+            create_at = int(time())
             for signin in signin_list:
                 if signin['status'] == 1 and signin['checkIn'] == 0:
-                    create_at = int(time())
                     await self.claim_signin(
                         signin_id=signin['id'],
                         create_at=create_at
@@ -1191,50 +1110,36 @@ class BaseBot:
             await asyncio.sleep(3)
 
     async def get_wallet_info(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/wallet/getWallet'
-            )
-            return response['data'] if response else []
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error getting wallet info: {error}")
-            await asyncio.sleep(3)
-            return []
+        return await self._get_data(_URL.GET_WALLET, "getting wallet info", default=[])
 
+    @_safe("❌ Wallet connection error", default=False)
     async def bind_wallet(self, wallet_data: Dict[str, Any]) -> bool:
-        try:
-            required_fields = ["public_key", "wallet_address", "raw_address"]
-            for field in required_fields:
-                if field not in wallet_data:
-                    logger.error(f"{self.session_name} | Missing required field: {field}")
-                    return False
-            
-            bind_data = {
-                "walletType": 1,
-                "publicKey": wallet_data["public_key"],
-                "friendlyAddress": wallet_data["wallet_address"],
-                "rawAddress": wallet_data["raw_address"]
-            }
-            
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/wallet/bind',
-                json=bind_data
-            )
-            
-            if response and response.get('code') == 0:
-                logger.success(f"{self.session_name} | ✅ Wallet connected successfully")
-                return True
-                
-            error_msg = response.get('message', 'Unknown error') if response else 'No server response'
-            logger.error(f"{self.session_name} | ❌ Wallet connection error: {error_msg}")
-            return False
-            
-        except Exception as error:
-            logger.error(f"{self.session_name} | ❌ Wallet connection error: {error}")
-            await asyncio.sleep(3)
-            return False
+        required_fields = ["public_key", "wallet_address", "raw_address"]
+        for field in required_fields:
+            if field not in wallet_data:
+                logger.error(f"{self.session_name} | Missing required field: {field}")
+                return False
+
+        bind_data = {
+            "walletType": 1,
+            "publicKey": wallet_data["public_key"],
+            "friendlyAddress": wallet_data["wallet_address"],
+            "rawAddress": wallet_data["raw_address"]
+        }
+
+        response = await self.make_request(
+            method='POST',
+            url=_URL.BIND_WALLET,
+            json=bind_data
+        )
+
+        if response and response.get('code') == 0:
+            logger.success(f"{self.session_name} | ✅ Wallet connected successfully")
+            return True
+
+        error_msg = response.get('message', 'Unknown error') if response else 'No server response'
+        logger.error(f"{self.session_name} | ❌ Wallet connection error: {error_msg}")
+        return False
 
     async def process_wallet_binding(self) -> None:
         try:
@@ -1249,9 +1154,9 @@ class BaseBot:
             logger.info(f"{self.session_name} | Preparing wallet connection...")
             await asyncio.sleep(randint(1, 3))
 
-            wallet_data = get_wallet_data(CONFIG_PATH, self.session_name)
+            wallet_data = await get_wallet_data(CONFIG_PATH, self.session_name)
             if not wallet_data:
-                wallet_data = create_and_save_wallet(CONFIG_PATH, self.session_name)
+                wallet_data = await create_and_save_wallet(CONFIG_PATH, self.session_name)
 
             if not wallet_data:
                 logger.error(f"{self.session_name} | Failed to create/get wallet data")
@@ -1264,37 +1169,22 @@ class BaseBot:
             await asyncio.sleep(3)
 
     async def get_upgrade_tasks(self) -> Dict[str, Any]:
-        try:
-            response = await self.make_request(
-                method='GET',
-                url='https://bi.yescoin.gold/task/getUserUpgradeTaskList'
-            )
-            return response['data'] if response else {}
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error getting upgrade tasks: {error}")
-            await asyncio.sleep(3)
-            return {}
+        return await self._get_data(_URL.UPGRADE_TASKS, "getting upgrade tasks")
 
+    @_safe("Error claiming level up reward", default=False)
     async def claim_upgrade_reward(self, task_id: str) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/task/finishUserUpgradeTask',
-                json=str(task_id)
-            )
-            
-            if response and response.get('code') == 0:
-                bonus_amount = response['data'].get('bonusAmount', 0)
-                return True
-                
-            error_msg = response.get('message', 'Unknown error') if response else 'No server response'
-            logger.error(f"{self.session_name} | ❌ Level up reward error: {error_msg}")
-            return False
-            
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error claiming level up reward: {error}")
-            await asyncio.sleep(3)
-            return False
+        response = await self.make_request(
+            method='POST',
+            url=_URL.FINISH_UPGRADE_TASK,
+            json=str(task_id)
+        )
+
+        if response and response.get('code') == 0:
+            return True
+
+        error_msg = response.get('message', 'Unknown error') if response else 'No server response'
+        logger.error(f"{self.session_name} | ❌ Level up reward error: {error_msg}")
+        return False
 
     async def process_upgrade_tasks(self) -> None:
         try:
@@ -1305,43 +1195,34 @@ class BaseBot:
             tasks = upgrade_data.get('taskBonusBaseResponseList', [])
             user_level = upgrade_data.get('userLevel', 0)
 
-            for task in tasks:
-                task_id = task['taskId']
-                task_status = task['taskStatus']
-                task_level = task['taskUserLevel']
-                bonus_amount = task['taskBonusAmount']
-
-                if task_status == 0 and task_level <= user_level:
-                    if await self.claim_upgrade_reward(task_id):
-                        logger.success(
-                            f"{self.session_name} | "
-                            f"✅ Level {task_level} reward claimed | "
-                            f"💰 Amount: {bonus_amount}"
-                        )
-                    await asyncio.sleep(1)
+            claimable = [task for task in tasks
+                         if task['taskStatus'] == 0 and task['taskUserLevel'] <= user_level]
+            for task in claimable:
+                if await self.claim_upgrade_reward(task['taskId']):
+                    logger.success(
+                        f"{self.session_name} | "
+                        f"✅ Level {task['taskUserLevel']} reward claimed | "
+                        f"💰 Amount: {task['taskBonusAmount']}"
+                    )
+                await asyncio.sleep(0)
 
         except Exception as error:
             logger.error(f"{self.session_name} | Error processing upgrade tasks: {error}")
             await asyncio.sleep(3)
 
+    @_safe("Error claiming daily tasks bonus", default=False)
     async def claim_daily_bonus(self, bonus_type: int) -> bool:
-        try:
-            response = await self.make_request(
-                method='POST',
-                url='https://bi.yescoin.gold/task/claimBonus',
-                json=bonus_type
-            )
-            
-            if response and response.get('code') == 0:
-                bonus_amount = response['data'].get('bonusAmount', 0)
-                logger.success(f"{self.session_name} | ✅ Daily tasks bonus claimed: {bonus_amount}")
-                return True
-            return False
-            
-        except Exception as error:
-            logger.error(f"{self.session_name} | Error claiming daily tasks bonus: {error}")
-            await asyncio.sleep(3)
-            return False
+        response = await self.make_request(
+            method='POST',
+            url=_URL.CLAIM_BONUS,
+            json=bonus_type
+        )
+
+        if response and response.get('code') == 0:
+            bonus_amount = response['data'].get('bonusAmount', 0)
+            logger.success(f"{self.session_name} | ✅ Daily tasks bonus claimed: {bonus_amount}")
+            return True
+        return False
 
 
 async def run_tapper(tg_client: UniversalTelegramClient):
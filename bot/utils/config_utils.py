@@ -2,20 +2,32 @@ import asyncio
 import json
 from bot.utils import logger, log_error, AsyncInterProcessLock
 from opentele.api import API
-from os import path, remove
+from os import path, remove, stat
 from copy import deepcopy
 
+_CONFIG_CACHE: dict = {}
+
 
 def read_config_file(config_path: str) -> dict:
     try:
-        with open(config_path, 'r') as file:
-            content = file.read()
-            return json.loads(content) if content else {}
+        st = stat(config_path)
     except FileNotFoundError:
         with open(config_path, 'w'):
             logger.warning(f"Accounts config file `{config_path}` not found. Creating a new one.")
         return {}
 
+    sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached and cached[0] == sig:
+        return cached[1]
+
+    with open(config_path, 'r') as file:
+        content = file.read()
+    config = json.loads(content) if content else {}
+    # Treat the cached dict as read-only: copy before mutating.
+    _CONFIG_CACHE[config_path] = (sig, config)
+    return config
+
 
 async def write_config_file(content: dict, config_path: str) -> None:
     lock = AsyncInterProcessLock(path.join(path.dirname(config_path), 'lock_files', 'accounts_config.lock'))
@@ -30,7 +42,7 @@ def get_session_config(session_name: str, config_path: str) -> dict:
 
 
 async def update_session_config_in_file(session_name: str, updated_session_config: dict, config_path: str) -> None:
-    config = read_config_file(config_path)
+    config = dict(read_config_file(config_path))
     config[session_name] = updated_session_config
     await write_config_file(config, config_path)
 
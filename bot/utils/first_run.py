@@ -1,12 +1,33 @@
+import asyncio
+
 import aiofiles
 
+_FIRST_RUN_FILE = 'first_run.txt'
+_known_sessions: set | None = None
+_lock = asyncio.Lock()
+
+
+async def _load_known_sessions() -> set:
+    global _known_sessions
+    if _known_sessions is None:
+        async with aiofiles.open(_FIRST_RUN_FILE, mode='a+') as file:
+            await file.seek(0)
+            lines = await file.readlines()
+        _known_sessions = {line.strip() for line in lines}
+    return _known_sessions
+
+
 async def check_is_first_run(session_name: str):
-    async with aiofiles.open('first_run.txt', mode='a+') as file:
-        await file.seek(0)
-        lines = await file.readlines()
-    return session_name.lower() not in [line.strip() for line in lines]
+    async with _lock:
+        return session_name.lower() not in await _load_known_sessions()
 
 
 async def append_recurring_session(session_name: str):
-    async with aiofiles.open('first_run.txt', mode='a+') as file:
-        await file.writelines(session_name.lower() + '\n')
+    session_name = session_name.lower()
+    async with _lock:
+        known = await _load_known_sessions()
+        if session_name in known:
+            return
+        known.add(session_name)
+        async with aiofiles.open(_FIRST_RUN_FILE, mode='a+') as file:
+            await file.writelines(session_name + '\n')
@@ -8,6 +8,12 @@ from better_proxy import Proxy
 from bot.config import settings
 from bot.utils import logger
 from random import shuffle
+from time import monotonic
+
+# A proxy that just answered doesn't need re-verification on every cycle;
+# remember successful checks for a while and skip the external round-trip.
+_PROXY_CHECK_TTL = 600
+_proxy_checked_at: dict[str, float] = {}
 
 PROXY_TYPES = {
     'socks5': ProxyType.SOCKS5,
@@ -62,6 +68,10 @@ def get_unused_proxies(accounts_config: dict, proxy_path: str) -> list[str]:
 
 
 async def check_proxy(proxy: str) -> bool:
+    checked_at = _proxy_checked_at.get(proxy)
+    if checked_at is not None and monotonic() - checked_at < _PROXY_CHECK_TTL:
+        return True
+
     url = 'https://ifconfig.me/ip'
     proxy_conn = ProxyConnector.from_url(proxy)
     try:
@@ -71,9 +81,11 @@ async def check_proxy(proxy: str) -> bool:
                 logger.success(f"Successfully connected to proxy. IP: {await response.text()}")
                 if not proxy_conn.closed:
                     proxy_conn.close()
+                _proxy_checked_at[proxy] = monotonic()
                 return True
     except Exception:
         logger.warning(f"Proxy {proxy} didn't respond")
+        _proxy_checked_at.pop(proxy, None)
         return False
 
 
@@ -1,9 +1,9 @@
 import json
-from os import path
+from typing import Dict, Tuple
 from tonsdk.contract.wallet import Wallets, WalletVersionEnum
 
 
-def generate_wallet(config_path: str, wallets_path=None):
+def generate_wallet(config_path: str, wallets_path=None) -> Tuple[str, Dict[str, str]]:
     mnemonics, public_key, private_key, wallet = Wallets.create(WalletVersionEnum.v4r2, workchain=0)
     wallet_address = wallet.address.to_string(True, True, False)
     wall = {
@@ -12,10 +12,10 @@ def generate_wallet(config_path: str, wallets_path=None):
         "private_key": private_key.hex(),
         "wallet_address": wallet_address
     }
-    if not wallets_path:
-        wallets_path = path.join(path.dirname(config_path), 'wallets.txt')
+    # Backward-compat: callers that still pass a path get the old on-disk dump;
+    # the wallet dict is returned either way so new callers skip the round-trip.
+    if wallets_path:
+        with open(wallets_path, "a+") as f:
+            json.dump(wall, f, indent=4)
 
-    with open(wallets_path, "a+") as f:
-        json.dump(wall, f, indent=4)
-
-    return wallet_address
\ No newline at end of file
+    return wallet_address, wall
@@ -1,84 +1,150 @@
 from typing import Dict, Optional, Any
-import json
+import asyncio
 import os
+import tempfile
 from pathlib import Path
 
+import aiofiles
+import orjson
+
 from bot.utils.ton import generate_wallet
 from bot.utils import logger
 
+# Parsed-config caches keyed by path; values are (stat signature, dict).
+# Cached dicts are shared and must be treated as read-only by callers.
+_WALLET_CACHE: Dict[str, tuple] = {}
+_ACCOUNTS_CACHE: Dict[str, tuple] = {}
+
+# Serialize read-modify-write sequences on the shared config files so
+# concurrently starting sessions cannot interleave between the load and the
+# save and clobber each other's entries. _WALLET_LOCK is always taken before
+# _ACCOUNTS_LOCK (create_and_save_wallet nests them in that order).
+_WALLET_LOCK = asyncio.Lock()
+_ACCOUNTS_LOCK = asyncio.Lock()
+
+
+def _write_json_atomic(file_path: Path, data: Dict[str, Any]) -> None:
+    # Write to a sibling temp file and os.replace() it into place so a crash
+    # mid-write can never leave a truncated config behind. mkstemp gives each
+    # writer its own temp file, so concurrent saves cannot race on a shared
+    # name. The fsync makes this a blocking call — run it via
+    # asyncio.to_thread from coroutines.
+    fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f'{file_path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
-def load_wallet_config(config_path: str) -> Dict[str, Any]:
+async def _read_json_cached(file_path: Path, cache: Dict[str, tuple]) -> Dict[str, Any]:
+    key = str(file_path)
+    st = os.stat(key)
+    sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+    cached = cache.get(key)
+    if cached and cached[0] == sig:
+        return cached[1]
+
+    async with aiofiles.open(key, 'rb') as f:
+        config = orjson.loads(await f.read())
+    cache[key] = (sig, config)
+    return config
+
+
+async def load_wallet_config(config_path: str) -> Dict[str, Any]:
     wallet_config_path = Path(config_path).parent / 'wallet_config.json'
     if not wallet_config_path.exists():
-        with open(wallet_config_path, 'w') as f:
-            json.dump({}, f, indent=4)
+        async with aiofiles.open(wallet_config_path, 'wb') as f:
+            await f.write(b'{}')
         return {}
-    
-    with open(wallet_config_path, 'r') as f:
-        return json.load(f)
+
+    return await _read_json_cached(wallet_config_path, _WALLET_CACHE)
 
 
-def save_wallet_config(config_path: str, wallet_data: Dict[str, Any]) -> None:
+async def save_wallet_config(config_path: str, wallet_data: Dict[str, Any]) -> None:
     wallet_config_path = Path(config_path).parent / 'wallet_config.json'
-    
-    with open(wallet_config_path, 'w') as f:
-        json.dump(wallet_data, f, indent=4)
 
+    await asyncio.to_thread(_write_json_atomic, wallet_config_path, wallet_data)
 
-def get_wallet_data(config_path: str, session_name: str) -> Optional[Dict[str, Any]]:
-    wallet_config = load_wallet_config(config_path)
+    st = os.stat(wallet_config_path)
+    _WALLET_CACHE[str(wallet_config_path)] = ((st.st_mtime_ns, st.st_size, st.st_ino), wallet_data)
+
+
+async def get_wallet_data(config_path: str, session_name: str) -> Optional[Dict[str, Any]]:
+    wallet_config = await load_wallet_config(config_path)
     return wallet_config.get(session_name)
 
 
-def update_accounts_config_wallet(config_path: str, session_name: str, wallet_address: str) -> None:
+async def update_accounts_config_wallet(config_path: str, session_name: str, wallet_address: str) -> bool:
+    """Store the wallet address for a session; returns True once the address
+    is present in accounts_config (written now or already there)."""
     accounts_config_path = Path(config_path).parent / 'accounts_config.json'
     if not accounts_config_path.exists():
-        return
-
-    with open(accounts_config_path, 'r') as f:
-        accounts_config = json.load(f)
-
-    if session_name in accounts_config:
-        if 'ton_address' not in accounts_config[session_name]:
-            accounts_config[session_name]['ton_address'] = wallet_address
-            with open(accounts_config_path, 'w') as f:
-                json.dump(accounts_config, f, indent=4)
-
-
-def create_and_save_wallet(config_path: str, session_name: str) -> Dict[str, Any]:
-    wallet_config = load_wallet_config(config_path)
-    
-    if session_name in wallet_config:
-        # Если кошелек уже существует, обновляем accounts_config
-        update_accounts_config_wallet(config_path, session_name, wallet_config[session_name]['wallet_address'])
-        return wallet_config[session_name]
-    
-    temp_wallet_path = Path(config_path).parent / f'temp_wallet_{session_name}.json'
-    
-    try:
-        wallet_address = generate_wallet(config_path, str(temp_wallet_path))
-        
-        with open(temp_wallet_path, 'r') as f:
-            wallet_data = json.load(f)
-        
-        if ':' in wallet_address:
-            _, address = wallet_address.split(':')
-            wallet_data['raw_address'] = address
-        else:
-            wallet_data['raw_address'] = wallet_address
-            
-        wallet_config[session_name] = wallet_data
-        save_wallet_config(config_path, wallet_config)
-        
-        # Обновляем ton_address в accounts_config
-        update_accounts_config_wallet(config_path, session_name, wallet_address)
-        
-        return wallet_config[session_name]
-        
-    except Exception as e:
-        logger.error(f"Error creating wallet: {str(e)}")
-        raise
-        
-    finally:
-        if temp_wallet_path.exists():
-            os.remove(temp_wallet_path) 
\ No newline at end of file
+        return False
+
+    async with _ACCOUNTS_LOCK:
+        accounts_config = await _read_json_cached(accounts_config_path, _ACCOUNTS_CACHE)
+
+        session_config = accounts_config.get(session_name)
+        if session_config is None:
+            return False
+        if 'ton_address' in session_config:
+            # Already recorded — skip the rewrite of the whole file.
+            return True
+
+        accounts_config = dict(accounts_config)
+        accounts_config[session_name] = {**session_config, 'ton_address': wallet_address}
+        await asyncio.to_thread(_write_json_atomic, accounts_config_path, accounts_config)
+        st = os.stat(accounts_config_path)
+        _ACCOUNTS_CACHE[str(accounts_config_path)] = ((st.st_mtime_ns, st.st_size, st.st_ino), accounts_config)
+        return True
+
+
+async def create_and_save_wallet(config_path: str, session_name: str) -> Dict[str, Any]:
+    # Hold the lock across the whole load-mutate-save sequence: every await in
+    # here is a point where another session could otherwise read the same
+    # wallet_config and overwrite this session's freshly generated wallet.
+    async with _WALLET_LOCK:
+        wallet_config = dict(await load_wallet_config(config_path))
+
+        if session_name in wallet_config:
+            wallet_data = wallet_config[session_name]
+            # Если кошелек уже существует, обновляем accounts_config
+            if not wallet_data.get('ton_address_synced'):
+                if await update_accounts_config_wallet(config_path, session_name, wallet_data['wallet_address']):
+                    wallet_data = {**wallet_data, 'ton_address_synced': True}
+                    wallet_config[session_name] = wallet_data
+                    await save_wallet_config(config_path, wallet_config)
+            return wallet_data
+
+        try:
+            # Key derivation is CPU-bound; keep it off the event loop. The wallet
+            # dict comes back directly — no temp-file round-trip.
+            wallet_address, wallet_data = await asyncio.to_thread(generate_wallet, config_path)
+
+            if ':' in wallet_address:
+                _, address = wallet_address.split(':')
+                wallet_data['raw_address'] = address
+            else:
+                wallet_data['raw_address'] = wallet_address
+
+            wallet_config[session_name] = wallet_data
+
+            # Обновляем ton_address в accounts_config
+            if await update_accounts_config_wallet(config_path, session_name, wallet_address):
+                wallet_data['ton_address_synced'] = True
+
+            await save_wallet_config(config_path, wallet_config)
+
+            return wallet_config[session_name]
+
+        except Exception as e:
+            logger.error(f"Error creating wallet: {str(e)}")
+            raise
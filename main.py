@@ -4,6 +4,13 @@ from bot.core.launcher import process
 from os import system, name as os_name, environ
 import os
 
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    # uvloop is not available on Windows; the default loop is used there.
+    uvloop = None
+
 def is_docker() -> bool:
     path = '/proc/self/cgroup'
     return os.path.exists('/.dockerenv') or (os.path.isfile(path) and any('docker' in line for line in open(path)))